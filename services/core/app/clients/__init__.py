@@ -1,5 +1,17 @@
 """Database client exports."""
 
-from app.clients.db import engine, get_session
+from app.clients.db import (
+    AsyncSessionLocal,
+    ScopedSession,
+    build_engine,
+    engine,
+    get_session,
+)
 
-__all__ = ["engine", "get_session"]
+__all__ = [
+    "AsyncSessionLocal",
+    "ScopedSession",
+    "build_engine",
+    "engine",
+    "get_session",
+]
@@ -1,29 +1,87 @@
 """Database client and session management."""
 
-from collections.abc import Generator
-
-from sqlalchemy.engine import Engine
-from sqlmodel import Session, create_engine
-
-from app.config import settings
-
-# Create engine with connection pooling
-engine: Engine = create_engine(
-    str(settings.SQLALCHEMY_DATABASE_URI),
-    # Connection pool settings
-    pool_pre_ping=True,  # Verify connections before using
-    pool_size=5,  # Number of connections to maintain
-    max_overflow=10,  # Max connections beyond pool_size
-    pool_recycle=3600,  # Recycle connections after 1 hour
-    echo=False,  # Set to True for SQL query logging
+from asyncio import current_task
+from collections.abc import AsyncGenerator
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
 )
 
+from app.config import get_database_url, settings
+
+if settings.POSTGRES_PGBOUNCER:
+    # PgBouncer transaction mode can't keep server-side prepared statements
+    # across transactions, so disable both asyncpg's and SQLAlchemy's caches
+    # and give each statement a unique name.
+    connect_args: dict[str, object] = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+else:
+    # Direct connections keep prepared statements for their whole lifetime
+    connect_args = {"prepared_statement_cache_size": 500}
+
+
+def build_engine(url: str | URL, **overrides: Any) -> AsyncEngine:
+    """Create an async engine with the service's pool configuration.
+
+    Args:
+        url: Database URL
+        overrides: Engine options that replace the defaults
+
+    Returns:
+        AsyncEngine: Configured async engine
+    """
+    options: dict[str, Any] = {
+        # Connection pool settings
+        # No SELECT 1 per checkout: a disconnect error invalidates the pool
+        # instead, so later checkouts get fresh connections.
+        "pool_pre_ping": False,
+        "pool_size": 20,  # Number of connections to maintain
+        "max_overflow": 10,  # Max connections beyond pool_size
+        "pool_timeout": 30,  # Seconds to wait for a free connection
+        "pool_recycle": 1800,  # Recycle before DB/LB idle timeouts drop them
+        "connect_args": connect_args,
+        # Batch multi-row INSERT ... RETURNING into pages of 1000 rows
+        "insertmanyvalues_page_size": 1000,
+        "echo": False,  # Set to True for SQL query logging
+    }
+    options.update(overrides)
+    return create_async_engine(url, **options)
+
+
+# Create async engine with connection pooling. Postgres is normally fronted
+# by PgBouncer in transaction pooling mode, which bounds the number of server
+# connections, so the app-side pool is sized to worker concurrency.
+engine: AsyncEngine = build_engine(get_database_url())
+
+AsyncSessionLocal = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    autoflush=False,  # Routes commit explicitly; don't flush before every query
+    expire_on_commit=False,  # Don't re-SELECT attributes after commit
+)
+
+# Task-local session registry: every call within the same request task
+# reuses one session instead of building a new one per dependency.
+ScopedSession = async_scoped_session(AsyncSessionLocal, scopefunc=current_task)
+
 
-def get_session() -> Generator[Session, None, None]:
-    """Get a database session.
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get the database session for the current task.
 
     Yields:
-        Session: SQLModel database session
+        AsyncSession: Async database session
     """
-    with Session(engine) as session:
-        yield session
+    try:
+        yield ScopedSession()
+    finally:
+        await ScopedSession.remove()
@@ -2,12 +2,14 @@
 
 import secrets
 import warnings
+from functools import cached_property, lru_cache
 from typing import Annotated, Any, Literal, Self
 
 from pydantic import (
     AnyUrl,
     BeforeValidator,
     PostgresDsn,
+    PrivateAttr,
     computed_field,
     model_validator,
 )
@@ -32,6 +34,8 @@ class Settings(BaseSettings):
         env_file=[".env", "../.env"],
         env_ignore_empty=True,
         extra="ignore",
+        # Frozen so the cached computed fields below can never go stale
+        frozen=True,
     )
     API_V1_STR: str = "/api/v1"
     SECRET_KEY: str = secrets.token_urlsafe(32)
@@ -42,13 +46,18 @@ class Settings(BaseSettings):
         list[AnyUrl] | str, BeforeValidator(parse_cors)
     ] = []
 
-    @computed_field  # type: ignore[prop-decorator]
+    _all_cors_origins: tuple[str, ...] = PrivateAttr(default=())
+
+    def model_post_init(self, context: Any, /) -> None:
+        """Precompute the CORS origins once the fields are loaded."""
+        self._all_cors_origins = tuple(
+            str(origin).rstrip("/") for origin in self.BACKEND_CORS_ORIGINS
+        ) + (self.FRONTEND_HOST,)
+
     @property
-    def all_cors_origins(self) -> list[str]:
+    def all_cors_origins(self) -> tuple[str, ...]:
         """Get all CORS origins."""
-        return [str(origin).rstrip("/") for origin in self.BACKEND_CORS_ORIGINS] + [
-            self.FRONTEND_HOST
-        ]
+        return self._all_cors_origins
 
     PROJECT_NAME: str = "Core Service"
     POSTGRES_SERVER: str = "localhost"
@@ -56,13 +65,15 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = "postgres"
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = "core_db"
+    # Whether POSTGRES_SERVER/PORT point at PgBouncer in transaction mode
+    POSTGRES_PGBOUNCER: bool = False
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def SQLALCHEMY_DATABASE_URI(self) -> PostgresDsn:  # type: ignore[report-property-type]
         """Build the SQLAlchemy database URI."""
         return PostgresDsn.build(
-            scheme="postgresql+psycopg",
+            scheme="postgresql+asyncpg",
             username=self.POSTGRES_USER,
             password=self.POSTGRES_PASSWORD,
             host=self.POSTGRES_SERVER,
@@ -90,4 +101,16 @@ class Settings(BaseSettings):
         return self
 
 
-settings = Settings()  # type: ignore
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings instance."""
+    return Settings()  # type: ignore
+
+
+@lru_cache(maxsize=1)
+def get_database_url() -> str:
+    """Get the SQLAlchemy database URL as a string."""
+    return str(get_settings().SQLALCHEMY_DATABASE_URI)
+
+
+settings = get_settings()
@@ -2,27 +2,43 @@
 
 import logging
 import sys
-from typing import Any
+
+import orjson
 
 from app.config import settings
 
 
+class JsonFormatter(logging.Formatter):
+    """Format log records as single-line JSON.
+
+    Uses the record's epoch timestamp instead of ``asctime`` so no
+    ``strftime`` call is made per record.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize a log record to JSON."""
+        payload = {
+            "time": record.created,
+            "name": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload).decode()
+
+
 def setup_logging() -> None:
     """Configure application logging."""
     log_level = logging.INFO
     if settings.ENVIRONMENT == "local":
         log_level = logging.DEBUG
 
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-        ],
-    )
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonFormatter())
+    logging.basicConfig(level=log_level, handlers=[handler])
 
     # Set specific logger levels
     logging.getLogger("uvicorn").setLevel(logging.INFO)
-    logging.getLogger("sqlalchemy.engine").setLevel(
-        logging.WARNING if settings.ENVIRONMENT != "local" else logging.INFO
-    )
+    # Per-query INFO logging is expensive; use echo=True on the engine instead
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
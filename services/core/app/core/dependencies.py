@@ -1,17 +1,22 @@
 """FastAPI dependencies."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 
-from fastapi import Depends
-from sqlmodel import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.clients.db import get_session
 
+# Entering get_session as a context manager throws the route's exception into
+# it, so its cleanup runs in the request task instead of a GC finalizer.
+_session_scope = asynccontextmanager(get_session)
 
-def get_db() -> Generator[Session, None, None]:
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get database session dependency.
 
     Yields:
-        Session: Database session
+        AsyncSession: Async database session
     """
-    yield from get_session()
+    async with _session_scope() as session:
+        yield session
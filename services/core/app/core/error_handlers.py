@@ -6,6 +6,13 @@ from sqlalchemy.exc import IntegrityError
 
 from app.core.exceptions import CoreException, NotFoundError, ValidationError
 
+# HTTP status for each core exception type
+_STATUS_BY_TYPE: dict[type[CoreException], int] = {
+    CoreException: status.HTTP_500_INTERNAL_SERVER_ERROR,
+    NotFoundError: status.HTTP_404_NOT_FOUND,
+    ValidationError: status.HTTP_400_BAD_REQUEST,
+}
+
 
 async def core_exception_handler(request: Request, exc: CoreException) -> JSONResponse:
     """Handle core exceptions.
@@ -17,11 +24,12 @@ async def core_exception_handler(request: Request, exc: CoreException) -> JSONRe
     Returns:
         JSONResponse: Error response
     """
-    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-    if isinstance(exc, NotFoundError):
-        status_code = status.HTTP_404_NOT_FOUND
-    elif isinstance(exc, ValidationError):
-        status_code = status.HTTP_400_BAD_REQUEST
+    status_code = _STATUS_BY_TYPE.get(type(exc))
+    if status_code is None:
+        # Subclasses fall back to their closest mapped base class
+        status_code = next(
+            _STATUS_BY_TYPE[cls] for cls in type(exc).__mro__ if cls in _STATUS_BY_TYPE
+        )
 
     return JSONResponse(
         status_code=status_code,
@@ -29,7 +37,9 @@ async def core_exception_handler(request: Request, exc: CoreException) -> JSONRe
     )
 
 
-async def integrity_error_handler(request: Request, exc: IntegrityError) -> JSONResponse:
+async def integrity_error_handler(
+    request: Request, exc: IntegrityError
+) -> JSONResponse:
     """Handle database integrity errors.
 
     Args:
@@ -1,4 +1,5 @@
 from contextlib import asynccontextmanager
+from functools import cache
 
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
@@ -13,18 +14,25 @@ from app.core.exceptions import CoreException
 from app.routes import api_router
 
 
+@cache
+def _make_unique_id(tag: str, name: str) -> str:
+    return f"{tag}-{name}"
+
+
 def custom_generate_unique_id(route: APIRoute) -> str:
-    return f"{route.tags[0]}-{route.name}"
+    return _make_unique_id(route.tags[0], route.name)
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI):
+async def lifespan(app: FastAPI):
     """Manage application lifespan events."""
     # Startup
     setup_logging()
+    # Build the OpenAPI schema once so the first docs request doesn't pay for it
+    app.openapi()
     yield
     # Shutdown: close database engine
-    engine.dispose()
+    await engine.dispose()
 
 
 app = FastAPI(
@@ -35,10 +43,11 @@ app = FastAPI(
 )
 
 # Set all CORS enabled origins
-if settings.all_cors_origins:
+all_cors_origins = settings.all_cors_origins
+if all_cors_origins:
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.all_cors_origins,
+        allow_origins=all_cors_origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -53,11 +62,19 @@ app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
 if __name__ == "__main__":
+    import os
+    from importlib.util import find_spec
+
     import uvicorn
 
+    # uvicorn[standard] installs uvloop everywhere except Windows, Cygwin and
+    # PyPy; use the asyncio loop and h11 wherever they are missing.
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="uvloop" if find_spec("uvloop") else "asyncio",
+        http="httptools" if find_spec("httptools") else "h11",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        reload=settings.ENVIRONMENT == "local",
     )
@@ -1,6 +1,6 @@
 """Example model for demonstration."""
 
-from datetime import UTC, datetime
+from datetime import datetime
 from typing import Optional
 
 from sqlmodel import Column, DateTime, Field, SQLModel, func
@@ -19,13 +19,16 @@ class Example(ExampleBase, table=True):
     __tablename__ = "examples"
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
+    # Timestamps are filled in by the database, not by Python defaults
+    created_at: Optional[datetime] = Field(
+        default=None,
         sa_column=Column(DateTime(timezone=True), server_default=func.now()),
     )
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
-        sa_column=Column(DateTime(timezone=True), onupdate=func.now()),
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        ),
     )
 
 
@@ -1,19 +1,24 @@
 """Example API routes."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from sqlalchemy import delete, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col, select
 
 from app.core.dependencies import get_db
 from app.models.example import Example, ExampleCreate, ExampleRead, ExampleUpdate
 
 router = APIRouter()
 
+# Columns needed to build an ExampleRead, selected or returned as plain rows
+_READ_COLUMNS = tuple(getattr(Example, name) for name in ExampleRead.model_fields)
+
 
 @router.post("", response_model=ExampleRead, status_code=status.HTTP_201_CREATED)
 async def create_example(
     example: ExampleCreate,
-    db: Session = Depends(get_db),
-) -> Example:
+    db: AsyncSession = Depends(get_db),
+) -> ExampleRead:
     """Create a new example.
 
     Args:
@@ -21,21 +26,20 @@ async def create_example(
         db: Database session
 
     Returns:
-        Example: Created example
+        ExampleRead: Created example
     """
-    db_example = Example.model_validate(example)
-    db.add(db_example)
-    db.commit()
-    db.refresh(db_example)
-    return db_example
+    statement = insert(Example).values(**example.model_dump()).returning(*_READ_COLUMNS)
+    row = (await db.execute(statement)).one()
+    await db.commit()
+    return ExampleRead.model_validate(row, from_attributes=True)
 
 
 @router.get("", response_model=list[ExampleRead])
 async def list_examples(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
-) -> list[Example]:
+    db: AsyncSession = Depends(get_db),
+) -> list[ExampleRead]:
     """List all examples.
 
     Args:
@@ -44,18 +48,20 @@ async def list_examples(
         db: Database session
 
     Returns:
-        List[Example]: List of examples
+        List[ExampleRead]: List of examples
     """
-    statement = select(Example).offset(skip).limit(limit)
-    examples = db.exec(statement).all()
-    return examples
+    # Select plain columns rather than entities so rows skip the identity
+    # map and attribute instrumentation.
+    statement = select(*_READ_COLUMNS).offset(skip).limit(limit)
+    result = await db.execute(statement)
+    return [ExampleRead.model_validate(row, from_attributes=True) for row in result]
 
 
 @router.get("/{example_id}", response_model=ExampleRead)
 async def get_example(
     example_id: int,
-    db: Session = Depends(get_db),
-) -> Example:
+    db: AsyncSession = Depends(get_db),
+) -> ExampleRead:
     """Get an example by ID.
 
     Args:
@@ -63,26 +69,26 @@ async def get_example(
         db: Database session
 
     Returns:
-        Example: Example data
+        ExampleRead: Example data
 
     Raises:
         HTTPException: If example not found
     """
-    example = db.get(Example, example_id)
+    example = await db.get(Example, example_id)
     if not example:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Example with ID {example_id} not found",
         )
-    return example
+    return ExampleRead.model_validate(example, from_attributes=True)
 
 
 @router.patch("/{example_id}", response_model=ExampleRead)
 async def update_example(
     example_id: int,
     example_update: ExampleUpdate,
-    db: Session = Depends(get_db),
-) -> Example:
+    db: AsyncSession = Depends(get_db),
+) -> ExampleRead:
     """Update an example.
 
     Args:
@@ -91,32 +97,33 @@ async def update_example(
         db: Database session
 
     Returns:
-        Example: Updated example
+        ExampleRead: Updated example
 
     Raises:
         HTTPException: If example not found
     """
-    example = db.get(Example, example_id)
-    if not example:
+    update_data = example_update.model_dump(exclude_unset=True)
+    statement = (
+        update(Example)
+        .where(col(Example.id) == example_id)
+        .values(**update_data)
+        .returning(*_READ_COLUMNS)
+        .execution_options(synchronize_session=False)
+    )
+    row = (await db.execute(statement)).one_or_none()
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Example with ID {example_id} not found",
         )
-
-    update_data = example_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(example, field, value)
-
-    db.add(example)
-    db.commit()
-    db.refresh(example)
-    return example
+    await db.commit()
+    return ExampleRead.model_validate(row, from_attributes=True)
 
 
 @router.delete("/{example_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_example(
     example_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> None:
     """Delete an example.
 
@@ -127,11 +134,16 @@ async def delete_example(
     Raises:
         HTTPException: If example not found
     """
-    example = db.get(Example, example_id)
-    if not example:
+    statement = (
+        delete(Example)
+        .where(col(Example.id) == example_id)
+        .returning(col(Example.id))
+        .execution_options(synchronize_session=False)
+    )
+    deleted_id = (await db.execute(statement)).scalar_one_or_none()
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Example with ID {example_id} not found",
         )
-    db.delete(example)
-    db.commit()
+    await db.commit()
@@ -11,6 +11,6 @@ async def example_task(data: dict) -> None:
     Args:
         data: Task data
     """
-    logger.info(f"Processing example task with data: {data}")
+    logger.info("Processing example task with data: %s", data)
     # Add your task logic here
     pass
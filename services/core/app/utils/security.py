@@ -6,6 +6,9 @@ import secrets
 
 from app.config import settings
 
+# BLAKE2b accepts keys of at most 64 bytes
+_HASH_KEY = settings.SECRET_KEY.encode()[:64]
+
 
 def generate_password_hash(password: str) -> str:
     """Generate a password hash.
@@ -16,12 +19,12 @@ def generate_password_hash(password: str) -> str:
     Returns:
         str: Hashed password
     """
-    # Using HMAC with secret key for password hashing
+    # Using keyed BLAKE2b (a built-in MAC, no HMAC wrapper) for password hashing
     # In production, use bcrypt or argon2
-    return hmac.new(
-        settings.SECRET_KEY.encode(),
+    return hashlib.blake2b(
         password.encode(),
-        hashlib.sha256,
+        key=_HASH_KEY,
+        digest_size=32,
     ).hexdigest()
 
 
@@ -35,10 +38,13 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if password matches
     """
-    return hmac.compare_digest(
-        generate_password_hash(plain_password),
-        hashed_password,
-    )
+    # Hash inline rather than via generate_password_hash to save a call frame
+    digest = hashlib.blake2b(
+        plain_password.encode(),
+        key=_HASH_KEY,
+        digest_size=32,
+    ).hexdigest()
+    return hmac.compare_digest(digest, hashed_password)
 
 
 def generate_token(length: int = 32) -> str:
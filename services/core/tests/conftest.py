@@ -1,48 +1,93 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
+from collections.abc import AsyncGenerator, Generator
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, create_engine, SQLModel
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    AsyncTransaction,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel
 
+from app.config import get_database_url, settings
 from app.core.dependencies import get_db
 from app.main import app
-from app.config import settings
-
-# Create a test database engine
-test_engine = create_engine(
-    str(settings.SQLALCHEMY_DATABASE_URI).replace(
-        settings.POSTGRES_DB, f"{settings.POSTGRES_DB}_test"
-    ),
-    connect_args={"check_same_thread": False} if "sqlite" in str(settings.SQLALCHEMY_DATABASE_URI) else {},
+
+# Create a test database engine. Connections are never reused across tests
+# (each test runs its requests on its own event loop), so skip pooling.
+test_engine = create_async_engine(
+    get_database_url().replace(settings.POSTGRES_DB, f"{settings.POSTGRES_DB}_test"),
+    poolclass=NullPool,
 )
 
 
-@pytest.fixture(scope="function")
-def db_session() -> Session:
-    """Create a test database session.
+async def _create_all(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+
+async def _drop_all(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+
+
+async def _begin(engine: AsyncEngine) -> tuple[AsyncConnection, AsyncTransaction]:
+    connection = await engine.connect()
+    return connection, await connection.begin()
+
+
+async def _rollback(connection: AsyncConnection, transaction: AsyncTransaction) -> None:
+    await transaction.rollback()
+    await connection.close()
+
+
+@pytest.fixture(scope="session")
+def db_engine() -> Generator[AsyncEngine, None, None]:
+    """Create the test database schema once for the whole test session.
 
     Yields:
-        Session: Test database session
+        AsyncEngine: Test database engine
     """
-    SQLModel.metadata.create_all(test_engine)
-    with Session(test_engine) as session:
-        yield session
-    SQLModel.metadata.drop_all(test_engine)
+    asyncio.run(_create_all(test_engine))
+    yield test_engine
+    asyncio.run(_drop_all(test_engine))
 
 
 @pytest.fixture(scope="function")
-def client(db_session: Session) -> TestClient:
-    """Create a test client.
+def client(db_engine: AsyncEngine) -> Generator[TestClient, None, None]:
+    """Create a test client whose database changes are rolled back.
+
+    Every request in a test shares one connection inside an outer
+    transaction; commits made by the routes only release savepoints, and
+    the outer transaction is rolled back when the test finishes.
 
     Args:
-        db_session: Test database session
+        db_engine: Test database engine
 
     Yields:
         TestClient: FastAPI test client
     """
-    def override_get_db():
-        yield db_session
+    with TestClient(app) as test_client:
+        portal = test_client.portal
+        assert portal is not None
+        connection, transaction = portal.call(_begin, db_engine)
+
+        async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+            async with AsyncSession(
+                bind=connection,
+                autoflush=False,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            ) as session:
+                yield session
 
-    app.dependency_overrides[get_db] = override_get_db
-    yield TestClient(app)
-    app.dependency_overrides.clear()
+        app.dependency_overrides[get_db] = override_get_db
+        yield test_client
+        app.dependency_overrides.clear()
+        portal.call(_rollback, connection, transaction)
@@ -0,0 +1,80 @@
+"""Tests for the database client."""
+
+from asyncio import current_task
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.clients import db
+from app.main import app
+
+
+def test_get_db_releases_connection_on_error(
+    db_engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that failed requests return their connection to the pool.
+
+    Args:
+        db_engine: Test database engine
+        monkeypatch: Pytest monkeypatch fixture
+    """
+    engine = create_async_engine(
+        db_engine.url, pool_size=2, max_overflow=0, pool_timeout=1
+    )
+    scoped_session = async_scoped_session(
+        async_sessionmaker(engine, expire_on_commit=False), scopefunc=current_task
+    )
+    monkeypatch.setattr(db, "ScopedSession", scoped_session)
+
+    with TestClient(app) as client:
+        for _ in range(5):
+            assert client.get("/api/v1/examples/99999").status_code == 404
+        assert client.get("/api/v1/examples").status_code == 200
+        assert engine.pool.checkedout() == 0  # type: ignore[attr-defined]
+        portal = client.portal
+        assert portal is not None
+        portal.call(engine.dispose)
+
+
+def test_request_recovers_after_backend_is_killed(
+    db_engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that requests get a fresh connection after one dies server-side.
+
+    Args:
+        db_engine: Test database engine
+        monkeypatch: Pytest monkeypatch fixture
+    """
+    engine = db.build_engine(db_engine.url, pool_size=1, max_overflow=0)
+    scoped_session = async_scoped_session(
+        async_sessionmaker(engine, expire_on_commit=False), scopefunc=current_task
+    )
+    monkeypatch.setattr(db, "ScopedSession", scoped_session)
+
+    async def backend_pid() -> int | None:
+        async with engine.connect() as conn:
+            return (await conn.execute(text("SELECT pg_backend_pid()"))).scalar()
+
+    async def terminate(pid: int | None) -> None:
+        async with db_engine.connect() as conn:
+            await conn.execute(text("SELECT pg_terminate_backend(:pid)"), {"pid": pid})
+
+    with TestClient(app, raise_server_exceptions=False) as client:
+        portal = client.portal
+        assert portal is not None
+        stale_pid = portal.call(backend_pid)
+        portal.call(terminate, stale_pid)
+
+        # The request that hits the dead connection fails and invalidates the
+        # pool; the next one reconnects.
+        assert client.get("/api/v1/examples").status_code == 500
+        assert client.get("/api/v1/examples").status_code == 200
+        assert portal.call(backend_pid) != stale_pid
+        portal.call(engine.dispose)
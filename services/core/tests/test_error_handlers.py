@@ -0,0 +1,39 @@
+"""Tests for error handlers."""
+
+import asyncio
+import json
+
+from fastapi import Request
+
+from app.core.error_handlers import core_exception_handler
+from app.core.exceptions import CoreException, NotFoundError, ValidationError
+
+
+class MissingWidgetError(NotFoundError):
+    """Subclass with no entry of its own in the status table."""
+
+
+def _handle(exc: CoreException) -> tuple[int, dict[str, str]]:
+    response = asyncio.run(core_exception_handler(Request({"type": "http"}), exc))
+    return response.status_code, json.loads(bytes(response.body))
+
+
+def test_not_found_error() -> None:
+    """Test that NotFoundError maps to 404."""
+    status_code, body = _handle(NotFoundError("missing"))
+    assert status_code == 404
+    assert body == {"detail": "missing", "type": "NotFoundError"}
+
+
+def test_validation_error() -> None:
+    """Test that ValidationError maps to 400."""
+    status_code, body = _handle(ValidationError("invalid"))
+    assert status_code == 400
+    assert body == {"detail": "invalid", "type": "ValidationError"}
+
+
+def test_unmapped_subclass_uses_base_status() -> None:
+    """Test that an unmapped subclass falls back to its closest mapped base."""
+    status_code, body = _handle(MissingWidgetError("no widget"))
+    assert status_code == 404
+    assert body == {"detail": "no widget", "type": "MissingWidgetError"}
@@ -0,0 +1,15 @@
+"""Tests for security utilities."""
+
+from app.utils.security import generate_password_hash, verify_password
+
+
+def test_verify_password_accepts_generated_hash() -> None:
+    """Test that a password verifies against its own hash."""
+    hashed = generate_password_hash("correct horse battery staple")
+    assert verify_password("correct horse battery staple", hashed)
+
+
+def test_verify_password_rejects_wrong_password() -> None:
+    """Test that a different password does not verify."""
+    hashed = generate_password_hash("correct horse battery staple")
+    assert not verify_password("wrong password", hashed)